@@ -12,6 +12,8 @@ def main():
     p_train.add_argument("--num-merges", type=int, default=50000, help="Number of BPE merges to learn")
     p_train.add_argument("--verbose", action="store_true", help="Print progress during training")
     p_train.add_argument("--log-every", type=int, default=1000, help="Print status every N merges when verbose")
+    p_train.add_argument("--num-workers", type=int, default=1, help="Processes used to count words in large corpora")
+    p_train.add_argument("--already-clean", action="store_true", help="Corpus is already Ethiopic-only; skip cleaning")
 
     args = parser.parse_args()
     if args.cmd == "train":
@@ -23,6 +25,8 @@ def main():
             num_merges=args.num_merges,
             verbose=args.verbose,
             log_every=args.log_every,
+            num_workers=args.num_workers,
+            already_clean=args.already_clean,
         )
         print(f"[AMH-Tokenizer] Saved model to {args.output_prefix}.json with {merges} merges")
 
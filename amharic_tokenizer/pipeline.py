@@ -12,18 +12,30 @@ def train_and_save(
     num_merges: int = 50000,
     verbose: bool = False,
     log_every: int = 1000,
+    num_workers: int = 1,
+    already_clean: bool = False,
 ) -> int:
     """Train the tokenizer on a corpus file and save the model.
 
     Args:
-        corpus_path: Path to UTF-8 text corpus (one big text file is fine).
+        corpus_path: Path to UTF-8 text corpus (one big text file is fine; it is
+            read line by line rather than loaded whole).
         output_prefix: Path prefix for output JSON model (without extension).
         num_merges: Number of BPE merges to learn (higher → longer subwords).
+        num_workers: Processes used to clean and count words in large corpora.
+        already_clean: Skip tokenizer-side cleaning for Ethiopic-only corpora,
+            such as the output of ``data_crawler/clean.py``.
     """
     path = Path(corpus_path)
-    text = path.read_text(encoding="utf-8")
 
     tokenizer = AmharicTokenizer(num_merges=num_merges)
-    learned = tokenizer.train(text, verbose=verbose, log_every=log_every)
+    with path.open(encoding="utf-8") as corpus:
+        learned = tokenizer.train_stream(
+            corpus,
+            verbose=verbose,
+            log_every=log_every,
+            num_workers=num_workers,
+            already_clean=already_clean,
+        )
     tokenizer.save(output_prefix)
     return learned
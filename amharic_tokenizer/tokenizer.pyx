@@ -1,12 +1,123 @@
 # amharic_tokenizer.pyx
 
+cimport cython
+from cpython cimport array
+import array
 import re
 import json
+import sys
+import heapq
 from collections import Counter
+from itertools import chain
+from multiprocessing import Pool
 from typing import List
 import time
 from amharic_tokenizer.fidel_map import AMHARIC_FIDEL_MAP, REVERSE_FIDEL_MAP
+
+try:
+    import orjson  # optional: much faster save() for large vocabularies
+except ImportError:
+    orjson = None
+
 start = time.time()
+
+# End-of-word marker appended to every word, and the unknown-token placeholder.
+# Interned so the marker is one shared object across words, merges and lookups.
+_EOW = sys.intern('<eow>')
+_UNK = sys.intern('<unk>')
+
+_NON_ETHIOPIC_RE = re.compile(r'[^\u1200-\u137F\s]+')
+# Fidel character -> tuple of its decomposed base + vowel characters.
+_DECOMPOSITION = {char: tuple(parts) for char, parts in AMHARIC_FIDEL_MAP.items()}
+# Character trie over REVERSE_FIDEL_MAP keys; _TRIE_END holds the composed fidel.
+_TRIE_END = object()
+cdef dict _COMPOSITION_TRIE = {}
+
+
+cdef void _build_composition_trie():
+    cdef dict node
+    cdef str decomposed, char
+    for decomposed, composed in REVERSE_FIDEL_MAP.items():
+        node = _COMPOSITION_TRIE
+        for char in decomposed:
+            node = node.setdefault(char, {})
+        node[_TRIE_END] = composed
+
+
+_build_composition_trie()
+
+cdef array.array _INDEX_ARRAY = array.array('q')
+cdef array.array _SYMBOL_ARRAY = array.array('i')
+# Corpora shorter than this are counted in-process even when workers are requested.
+_PARALLEL_MIN_CHARS = 1 << 20
+# Lines handed to each worker task by train_stream.
+_STREAM_BATCH_LINES = 10000
+
+
+def _count_shard_words(str text):
+    """Count cleaned words in one corpus shard; runs in worker processes."""
+    return Counter(_NON_ETHIOPIC_RE.sub('', text).split())
+
+
+def _count_clean_shard_words(str text):
+    """Count words in one already-cleaned corpus shard; runs in worker processes."""
+    return Counter(text.split())
+
+
+def _batch_lines(lines):
+    """Group an iterable of lines into newline-joined text batches."""
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) == _STREAM_BATCH_LINES:
+            yield '\n'.join(batch)
+            batch = []
+    if batch:
+        yield '\n'.join(batch)
+
+
+cdef list _split_shards(str text, int parts):
+    """Cut ``text`` into about ``parts`` pieces, only at whitespace."""
+    cdef list shards = []
+    cdef Py_ssize_t length = len(text)
+    cdef Py_ssize_t size = length // parts + 1
+    cdef Py_ssize_t begin = 0, end
+    while begin < length:
+        end = begin + size
+        while end < length and not text[end].isspace():
+            end += 1
+        shards.append(text[begin:end])
+        begin = end
+    return shards
+
+
+cdef inline void _add_pair(dict pair_freq, dict pair_positions, dict pair_order, set dirty, tuple pair, Py_ssize_t pos, Py_ssize_t count):
+    pair_freq[pair] = pair_freq.get(pair, 0) + count
+    if pair not in pair_order:
+        pair_order[pair] = len(pair_order)
+    if pair in pair_positions:
+        (<set>pair_positions[pair]).add(pos)
+    else:
+        pair_positions[pair] = {pos}
+    dirty.add(pair)
+
+
+cdef inline void _remove_pair(dict pair_freq, dict pair_positions, set dirty, tuple pair, Py_ssize_t pos, Py_ssize_t count):
+    cdef Py_ssize_t freq = pair_freq.get(pair, 0) - count
+    cdef set positions
+    if freq > 0:
+        pair_freq[pair] = freq
+        # The pair being merged (e.g. A A in a run A A A) has already been
+        # popped from pair_positions.
+        positions = pair_positions.get(pair)
+        if positions is not None:
+            positions.discard(pos)
+    else:
+        pair_freq.pop(pair, None)
+        pair_positions.pop(pair, None)
+    dirty.add(pair)
+
+
 cdef class AmharicTokenizer:
     """
     Optimized BPE Tokenizer for Amharic Fidel using Cython.
@@ -17,6 +128,8 @@ cdef class AmharicTokenizer:
 
     cdef public dict _vocabulary
     cdef public dict _merge_rank_map
+    # Derived from _merge_rank_map by _build_merge_rank_pairs; not saved state
+    cdef dict _merge_rank_pairs
     cdef public int _num_merges 
     cdef public int _max_vocab_size 
     cdef public dict _token_to_id
@@ -26,6 +139,7 @@ cdef class AmharicTokenizer:
     def __init__(self, int num_merges=50000, int max_vocab_size=30000):
         self._vocabulary = {}
         self._merge_rank_map = {}
+        self._merge_rank_pairs = {}
         self._num_merges = num_merges
         self._max_vocab_size = max_vocab_size 
         self._token_to_id = {}
@@ -39,11 +153,12 @@ cdef class AmharicTokenizer:
         - Removing English letters and numbers
         - Optionally remove unwanted punctuation
         - Keep Amharic Fidel characters and whitespace
+
+        ASCII letters and digits fall outside the Ethiopic block, so a single
+        pass removes them along with everything else; ``str.split`` then
+        collapses and strips whitespace.
         """
-        cleaned_text = re.sub(r'[A-Za-z0-9]', '', text)
-        cleaned_text = re.sub(r'[^\u1200-\u137F\s]', '', cleaned_text)
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
-        return cleaned_text
+        return ' '.join(_NON_ETHIOPIC_RE.sub('', text).split())
 
     cdef void _initialize_base_vocabulary(self):
         cdef set initial_tokens = set()
@@ -51,57 +166,207 @@ cdef class AmharicTokenizer:
         for char_list in AMHARIC_FIDEL_MAP.values():
             for char in char_list:
                 initial_tokens.add(char)
-        initial_tokens.add('<eow>')
-        initial_tokens.add('<unk>') 
+        initial_tokens.add(_EOW)
+        initial_tokens.add(_UNK)
         
         cdef list sorted_initial_tokens = sorted(list(initial_tokens))
         for token in sorted_initial_tokens:
             self._vocabulary[token] = 0
             self._add_to_vocab_maps(token)
 
+    cpdef void _build_merge_rank_pairs(self):
+        """
+        Index merge ranks by ``(left, right)`` token pairs.
+
+        Every way of splitting a merged token into two known tokens (or single
+        characters, which is what ``preprocess`` emits for unmapped input) gets
+        the merged token's rank, so looking up a pair tuple gives the same
+        answer as looking up the concatenated string in ``_merge_rank_map``.
+        """
+        cdef dict token_to_id = self._token_to_id
+        cdef dict rank_pairs = {}
+        cdef str token, left, right
+        cdef Py_ssize_t k
+        for token, rank in self._merge_rank_map.items():
+            for k in range(1, len(token)):
+                left = token[:k]
+                right = token[k:]
+                if (k == 1 or left in token_to_id) and (len(right) == 1 or right in token_to_id):
+                    rank_pairs[(left, right)] = rank
+        self._merge_rank_pairs = rank_pairs
+
     cdef void _add_to_vocab_maps(self, str token):
         if token not in self._token_to_id:
             self._token_to_id[token] = self._next_id
             self._id_to_token[self._next_id] = token
             self._next_id += 1
 
-    @staticmethod
-    def _get_pairs(tokens: List[str]):
-        cdef dict pairs = {}
-        cdef int i
-        cdef tuple pair
-        for i in range(len(tokens) - 1):
-            pair = (tokens[i], tokens[i+1])
-            pairs[pair] = pairs.get(pair, 0) + 1
-        return pairs
-
     cpdef List[List[str]] preprocess(self, str amharic_corpus):
         cdef list words = amharic_corpus.split()
         cdef list preprocessed_corpus = []
         cdef list mapped_word
-        cdef str char
+        cdef dict decomposition = _DECOMPOSITION
+        cdef tuple parts
+        cdef str word, char
         for word in words:
             mapped_word = []
             for char in word:
-                mapped_word.extend(list(AMHARIC_FIDEL_MAP.get(char, [char])))
-            mapped_word.append('<eow>')
+                parts = decomposition.get(char)
+                if parts is None:
+                    mapped_word.append(char)
+                else:
+                    mapped_word.extend(parts)
+            mapped_word.append(_EOW)
             preprocessed_corpus.append(mapped_word)
         return preprocessed_corpus
 
-    cpdef int train(self, str amharic_corpus, bint verbose=False, int log_every=1000):
-        cdef list tokenized_words = self.preprocess(self._clean_corpus(amharic_corpus))
-        cdef pair_counts = Counter()
+    cdef object _count_words(self, str amharic_corpus, int num_workers, bint already_clean):
+        """
+        Count cleaned words in the corpus, keyed in order of first occurrence.
+
+        With ``num_workers > 1`` and a large enough corpus, the text is split
+        at whitespace into shards that are cleaned and counted in a process
+        pool. Shard counts are merged in order, so the result is the same
+        as counting in a single pass. ``already_clean`` skips ``_clean_corpus``.
+        """
+        cdef object word_freq
+        if num_workers <= 1 or len(amharic_corpus) < _PARALLEL_MIN_CHARS:
+            if already_clean:
+                return Counter(amharic_corpus.split())
+            return Counter(self._clean_corpus(amharic_corpus).split())
+        word_freq = Counter()
+        count_shard = _count_clean_shard_words if already_clean else _count_shard_words
+        with Pool(num_workers) as pool:
+            for shard_freq in pool.map(count_shard, _split_shards(amharic_corpus, num_workers)):
+                word_freq.update(shard_freq)
+        return word_freq
+
+    cpdef int train(self, str amharic_corpus, bint verbose=False, int log_every=1000, int num_workers=1,
+                    bint already_clean=False):
+        """
+        Learn BPE merges from ``amharic_corpus``.
+
+        The corpus is first reduced to unique words with their frequencies, so
+        repeated words are decomposed and merged once and every pair count is
+        weighted by how often its word occurs. ``num_workers`` processes share
+        that counting pass on large corpora. Pass ``already_clean=True`` for
+        text that is already Ethiopic-only (e.g. ``clean_amharic_file`` output)
+        to skip the ``_clean_corpus`` pass.
+        """
+        return self._train_word_freq(
+            self._count_words(amharic_corpus, num_workers, already_clean), verbose, log_every
+        )
+
+    cpdef int train_stream(self, object lines, bint verbose=False, int log_every=1000, int num_workers=1,
+                           bint already_clean=False):
+        """
+        Learn BPE merges from an iterable of text lines, such as an open file.
+
+        Lines are cleaned and counted one at a time, so the full corpus never
+        has to be held as a single string. With ``num_workers > 1`` batches
+        of lines are counted in a process pool, in order, once the input has
+        run past ``_PARALLEL_MIN_CHARS``; shorter inputs never start the pool.
+        ``already_clean`` skips ``_clean_corpus`` as in ``train``.
+        """
+        cdef object word_freq = Counter()
+        cdef str line, batch
+        cdef Py_ssize_t counted = 0
+        if num_workers > 1:
+            count_shard = _count_clean_shard_words if already_clean else _count_shard_words
+            batches = _batch_lines(lines)
+            for batch in batches:
+                word_freq.update(count_shard(batch))
+                counted += len(batch)
+                if counted >= _PARALLEL_MIN_CHARS:
+                    break
+            batch = next(batches, None)
+            if batch is not None:
+                with Pool(num_workers) as pool:
+                    for shard_freq in pool.imap(count_shard, chain((batch,), batches)):
+                        word_freq.update(shard_freq)
+        elif already_clean:
+            for line in lines:
+                word_freq.update(line.split())
+        else:
+            for line in lines:
+                word_freq.update(self._clean_corpus(line).split())
+        return self._train_word_freq(word_freq, verbose, log_every)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int _train_word_freq(self, object word_freq, bint verbose, int log_every):
+        """
+        Run BPE merges over ``word_freq``, a ``Counter`` of cleaned words.
+
+        Tokens are interned to int32 symbol ids for the duration of training;
+        strings are only built when a merge is recorded. Every word is kept as
+        a doubly-linked list over flat ``symbols``/``prev_pos``/``next_pos``
+        arrays, and each adjacent id pair maps to the set of positions where
+        it starts. The most frequent pair is taken from a max-heap with lazy
+        deletion: stale entries are skipped on pop, and pairs whose counts
+        change during a merge are re-pushed once. Ties between equally
+        frequent pairs go to the pair seen first, which is the order a
+        ``max()`` scan over the pair counts would pick. A merge therefore only
+        touches the positions it rewrites instead of rescanning the whole
+        corpus.
+        """
+        cdef list tokenized_words = self.preprocess(' '.join(word_freq))
+        cdef list word_counts = list(word_freq.values())
         cdef list word_tokens
-        cdef dict word_pairs
+        cdef Py_ssize_t total = 0
         for word_tokens in tokenized_words:
-            word_pairs = self._get_pairs(word_tokens)
-            pair_counts.update(word_pairs)
+            total += len(word_tokens)
 
-        cdef int i, j
+        # Symbol id 0 is reserved for the end-of-word marker.
+        cdef dict symbol_ids = {_EOW: 0}
+        cdef list id_symbols = [_EOW]
+        cdef int[::1] symbols = array.clone(_SYMBOL_ARRAY, total, zero=False)
+        cdef long long[::1] counts = array.clone(_INDEX_ARRAY, total, zero=False)
+        cdef long long[::1] prev_pos = array.clone(_INDEX_ARRAY, total, zero=False)
+        cdef long long[::1] next_pos = array.clone(_INDEX_ARRAY, total, zero=False)
+        cdef dict pair_freq = {}
+        cdef dict pair_positions = {}
+        cdef dict pair_order = {}
+        cdef Py_ssize_t n, k, pos, left, right, nxt, count
+        cdef int symbol, symbol_a, symbol_b, new_symbol
+        cdef str token
+
+        pos = 0
+        for word_tokens, count in zip(tokenized_words, word_counts):
+            n = len(word_tokens)
+            for k in range(n):
+                token = word_tokens[k]
+                symbol = symbol_ids.get(token, -1)
+                if symbol == -1:
+                    symbol = len(id_symbols)
+                    symbol_ids[token] = symbol
+                    id_symbols.append(token)
+                symbols[pos] = symbol
+                counts[pos] = count
+                prev_pos[pos] = pos - 1 if k > 0 else -1
+                next_pos[pos] = pos + 1 if k < n - 1 else -1
+                pos += 1
+
+        cdef tuple pair
+        for pos in range(total):
+            nxt = next_pos[pos]
+            if nxt != -1:
+                pair = (symbols[pos], symbols[nxt])
+                pair_freq[pair] = pair_freq.get(pair, 0) + counts[pos]
+                if pair in pair_positions:
+                    (<set>pair_positions[pair]).add(pos)
+                else:
+                    pair_positions[pair] = {pos}
+                    pair_order[pair] = len(pair_order)
+
+        cdef list heap = [(-freq, pair_order[pair], pair) for pair, freq in pair_freq.items()]
+        heapq.heapify(heap)
+
+        cdef int i
+        cdef Py_ssize_t freq
         cdef str new_token
         cdef tuple best_pair
-        cdef list token_list, new_list, new_tokenized_words
-        cdef object new_pair_counts
+        cdef set dirty
         cdef float percent_done
 
         for i in range(self._num_merges):
@@ -116,127 +381,189 @@ cdef class AmharicTokenizer:
                 if (i + 1) % log_every == 0 or i == 0 or i == self._num_merges - 1:
                     print(f"\rTraining progress: {percent_done:.2f}% - Current vocab size: {len(self._vocabulary)}", end='', flush=True)
 
-            if not pair_counts:
+            # Pop until the top entry matches the pair's current count.
+            best_pair = None
+            while heap:
+                freq, _, pair = heapq.heappop(heap)
+                if pair_freq.get(pair, 0) == -freq:
+                    best_pair = pair
+                    break
+            if best_pair is None:
                 break
 
-            best_pair = max(pair_counts, key=pair_counts.get)
-            if pair_counts[best_pair] < 2:
+            freq = pair_freq[best_pair]
+            if freq < 2:
                 break
 
-            new_token = ''.join(best_pair)
+            symbol_a, symbol_b = best_pair
+            new_token = id_symbols[symbol_a] + id_symbols[symbol_b]
+            new_symbol = symbol_ids.get(new_token, -1)
+            if new_symbol == -1:
+                new_symbol = len(id_symbols)
+                symbol_ids[new_token] = new_symbol
+                id_symbols.append(new_token)
             if new_token not in self._vocabulary:
                 self._merge_rank_map[new_token] = len(self._merge_rank_map) + 1
-                self._vocabulary[new_token] = pair_counts[best_pair]
+                self._vocabulary[new_token] = freq
                 self._add_to_vocab_maps(new_token)
 
-            new_tokenized_words = []
-            new_pair_counts = pair_counts.copy()
-            for token_list in tokenized_words:
-                if new_token in ''.join(token_list) or best_pair in self._get_pairs(token_list):
-                    old_pairs = self._get_pairs(token_list)
-                    new_list = []
-                    j = 0
-                    while j < len(token_list):
-                        if j < len(token_list) - 1 and (token_list[j], token_list[j+1]) == best_pair:
-                            new_list.append(new_token)
-                            j += 2
-                        else:
-                            new_list.append(token_list[j])
-                            j += 1
-                    new_tokenized_words.append(new_list)
-                    new_pair_counts.subtract(old_pairs)
-                    new_pair_counts.update(self._get_pairs(new_list))
-                else:
-                    new_tokenized_words.append(token_list)
-            tokenized_words = new_tokenized_words
-            pair_counts = new_pair_counts
+            dirty = set()
+            # Ascending positions merge overlapping runs (e.g. A A A) left to right.
+            for pos in sorted(pair_positions.pop(best_pair)):
+                nxt = next_pos[pos]
+                if symbols[pos] != symbol_a or nxt == -1 or symbols[nxt] != symbol_b:
+                    continue  # consumed by an earlier merge in this pass
+                left = prev_pos[pos]
+                right = next_pos[nxt]
+                count = counts[pos]
+                if left != -1:
+                    symbol = symbols[left]
+                    _remove_pair(pair_freq, pair_positions, dirty, (symbol, symbol_a), left, count)
+                    _add_pair(pair_freq, pair_positions, pair_order, dirty, (symbol, new_symbol), left, count)
+                if right != -1:
+                    symbol = symbols[right]
+                    _remove_pair(pair_freq, pair_positions, dirty, (symbol_b, symbol), nxt, count)
+                    _add_pair(pair_freq, pair_positions, pair_order, dirty, (new_symbol, symbol), pos, count)
+                    prev_pos[right] = pos
+                symbols[pos] = new_symbol
+                symbols[nxt] = -1
+                next_pos[pos] = right
+            pair_freq.pop(best_pair, None)
+            dirty.discard(best_pair)
+
+            for pair in dirty:
+                freq = pair_freq.get(pair, 0)
+                if freq > 0:
+                    heapq.heappush(heap, (-freq, pair_order[pair], pair))
 
+        self._build_merge_rank_pairs()
         if verbose:
             print("\nTraining completed.")
         return len(self._merge_rank_map)
 
 
-    cpdef tuple _get_best_merge(self, list current_corpus, dict reversed_merge_map):
-        cdef tuple best_pair = None
-        cdef float highest_priority_rank = float('inf') 
-        cdef list token_list
-        cdef int j
-        cdef str pair_str
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef list _merge_word(self, list symbols, dict rank_map):
+        """
+        Apply learned merges to one decomposed word, lowest rank first.
+
+        Candidate pairs sit in a heap of ``(rank, position, left, right)``;
+        an entry is stale once either of its symbols has been merged away.
+        """
+        cdef Py_ssize_t n = len(symbols)
+        if n < 2:
+            return symbols
+        cdef list prev_pos = list(range(-1, n - 1))
+        cdef list next_pos = list(range(1, n + 1))
+        next_pos[n - 1] = -1
+        cdef list heap = []
+        cdef Py_ssize_t pos, nxt, left, right
         cdef object rank
-        for token_list in current_corpus:
-            for j in range(len(token_list) - 1):
-                pair_str = token_list[j] + token_list[j+1]
-                rank = reversed_merge_map.get(pair_str)
-                if rank is not None and rank < highest_priority_rank:
-                    highest_priority_rank = rank
-                    best_pair = (token_list[j], token_list[j+1])
-        return best_pair
+        cdef str token_a, token_b, merged
+
+        for pos in range(n - 1):
+            rank = rank_map.get((symbols[pos], symbols[pos + 1]))
+            if rank is not None:
+                heap.append((rank, pos, symbols[pos], symbols[pos + 1]))
+        heapq.heapify(heap)
+
+        while heap:
+            rank, pos, token_a, token_b = heapq.heappop(heap)
+            nxt = next_pos[pos]
+            if nxt == -1 or symbols[pos] != token_a or symbols[nxt] != token_b:
+                continue
+            merged = token_a + token_b
+            symbols[pos] = merged
+            symbols[nxt] = None
+            right = next_pos[nxt]
+            next_pos[pos] = right
+            if right != -1:
+                prev_pos[right] = pos
+                rank = rank_map.get((merged, symbols[right]))
+                if rank is not None:
+                    heapq.heappush(heap, (rank, pos, merged, symbols[right]))
+            left = prev_pos[pos]
+            if left != -1:
+                rank = rank_map.get((symbols[left], merged))
+                if rank is not None:
+                    heapq.heappush(heap, (rank, left, symbols[left], merged))
+
+        return [token for token in symbols if token is not None]
 
     cpdef List[str] tokenize(self, str text):
-        cdef list corpus = self.preprocess(text)
-        cdef dict reversed_merge_map = self._merge_rank_map
-        cdef tuple best_pair
-        cdef int i, j
-        cdef str pair_str
-        cdef list updated_corpus, token_list, new_token_list
-        while True:
-            best_pair = self._get_best_merge(corpus, reversed_merge_map)
-            if best_pair is None:
-                break
-            pair_str = ''.join(best_pair)
-            updated_corpus = []
-            for token_list in corpus:
-                new_token_list = []
-                i = 0
-                while i < len(token_list):
-                    if i < len(token_list) - 1 and (token_list[i], token_list[i+1]) == best_pair:
-                        new_token_list.append(pair_str)
-                        i += 2
-                    else:
-                        new_token_list.append(token_list[i])
-                        i += 1
-                updated_corpus.append(new_token_list)
-            corpus = updated_corpus
-        return [token for word_tokens in corpus for token in word_tokens]
+        """
+        Split ``text`` into subword tokens.
+
+        Words never merge across their ``<eow>`` boundary, so each word is
+        merged independently with its own small heap. Ranks are looked up by
+        token pair, which avoids building a concatenated string per candidate.
+        The pair index is rebuilt here if merges were assigned without it.
+        """
+        if not self._merge_rank_pairs and self._merge_rank_map:
+            self._build_merge_rank_pairs()
+        cdef dict rank_map = self._merge_rank_pairs
+        cdef list tokens = []
+        cdef list word_tokens
+        for word_tokens in self.preprocess(text):
+            tokens.extend(self._merge_word(word_tokens, rank_map))
+        return tokens
 
     cpdef List[int] encode(self, str text):
         cdef list tokens = self.tokenize(text)
-        return [self._token_to_id.get(token, self._token_to_id.get('<unk>', -1)) for token in tokens]
+        cdef dict token_to_id = self._token_to_id
+        cdef object unk_id = token_to_id.get(_UNK, -1)
+        return [token_to_id.get(token, unk_id) for token in tokens]
 
     cpdef str decode(self, List[int] token_ids):
-        cdef list tokens = [self._id_to_token.get(i, '<unk>') for i in token_ids]
+        cdef dict id_to_token = self._id_to_token
+        cdef list tokens = [id_to_token.get(i, _UNK) for i in token_ids]
         return self.detokenize(tokens)
 
     cpdef str detokenize(self, List[str] tokens):
-        cdef str temp_string = "".join(tokens).replace("<eow>", " ")
+        cdef str temp_string = "".join(tokens).replace(_EOW, " ")
         cdef list word_segments = temp_string.split()
         cdef list final_text_words = []
-        cdef int i, length
-        cdef str sub_string
-        cdef bint found_match
-        cdef list chars_list, reconstructed_word
-        cdef int MAX_CV_LENGTH = 3
-        
+        cdef Py_ssize_t i, j, n, match_end
+        cdef dict node
+        cdef object match
+        cdef list reconstructed_word
+        cdef str word_string
+
         for word_string in word_segments:
-            chars_list = list(word_string)
+            n = len(word_string)
             reconstructed_word = []
             i = 0
-            while i < len(chars_list):
-                found_match = False
-                for length in range(MAX_CV_LENGTH, 0, -1):
-                    sub_string = "".join(chars_list[i:i+length])
-                    if sub_string in REVERSE_FIDEL_MAP:
-                        reconstructed_word.append(REVERSE_FIDEL_MAP[sub_string])
-                        i += length
-                        found_match = True
+            while i < n:
+                # Walk the trie for the longest decomposed sequence starting at i.
+                node = _COMPOSITION_TRIE
+                match = None
+                match_end = i
+                j = i
+                while j < n:
+                    node = node.get(word_string[j])
+                    if node is None:
                         break
-                if not found_match:
-                    reconstructed_word.append(chars_list[i])
+                    j += 1
+                    if _TRIE_END in node:
+                        match = node[_TRIE_END]
+                        match_end = j
+                if match is None:
+                    reconstructed_word.append(word_string[i])
                     i += 1
+                else:
+                    reconstructed_word.append(match)
+                    i = match_end
             final_text_words.append("".join(reconstructed_word))
-        return " ".join(final_text_words).replace("<unk>", "")
+        return " ".join(final_text_words).replace(_UNK, "")
 
     cpdef void save(self, str file_path):
+        """
+        Write the tokenizer state to ``file_path`` as compact UTF-8 JSON.
+
+        Uses ``orjson`` when it is installed and the standard ``json`` module
+        otherwise; both produce the same data and load the same way.
+        """
         if not file_path.endswith(".json"):
             file_path += ".json"
 
@@ -249,8 +576,12 @@ cdef class AmharicTokenizer:
             'id_to_token': {str(k): v for k, v in self._id_to_token.items()}, 
             'next_id': self._next_id
         }
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(state, f, ensure_ascii=False, indent=4)
+        if orjson is not None:
+            payload = orjson.dumps(state)
+        else:
+            payload = json.dumps(state, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with open(file_path, 'wb') as f:
+            f.write(payload)
         print(f"Tokenizer state saved to {file_path}. {(time.time() - start)/60} Minutes")
 
     @classmethod
@@ -278,5 +609,6 @@ cdef class AmharicTokenizer:
         tokenizer._token_to_id = state['token_to_id']
         tokenizer._id_to_token = {int(k): v for k, v in state['id_to_token'].items()}
         tokenizer._next_id = state['next_id']
+        tokenizer._build_merge_rank_pairs()
         print(f"Tokenizer state loaded from {file_path}")
         return tokenizer
\ No newline at end of file
@@ -1,5 +1,13 @@
+import os
 import re
 
+# Compiled once at import; clean_amharic_file applies them to every line.
+_LATIN_RE = re.compile(r"[A-Za-z@#$%^&*_=+{}\[\]|\\<>~,]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_SPLIT_RE = re.compile(r"[።፤፣፥፧?!\"']+")
+_ETHIOPIC_RE = re.compile(r"[\u1200-\u137F]")
+
+
 def clean_amharic_file(input_path: str, output_path: str, min_length: int = 15):
     """
     Cleans Amharic text files:
@@ -7,38 +15,42 @@ def clean_amharic_file(input_path: str, output_path: str, min_length: int = 15):
     - Removes English letters, digits, and unwanted ASCII punctuation
     - Keeps Amharic letters and punctuation (።፤፣፥፧ ? ! " ')
     - Splits lines into sentences
+
+    The input is streamed line by line and sentences are written as they are
+    accepted, so only the set of already-seen sentences is held in memory.
+    Output goes to a temporary file that replaces ``output_path`` once the
+    input is fully read, so cleaning a file in place is safe.
     """
-    cleaned_lines = []
     seen = set()
-
-    with open(input_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    for line in lines:
-        text = line.strip()
-
-        if not text:
-            continue
-
-        # Remove Latin letters, digits, and unwanted ASCII punctuation
-        text = re.sub(r"[A-Za-z@#$%^&*_=+{}\[\]|\\<>~,]+", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
-
-        # Split by Amharic + modern punctuation
-        split_sentences = re.split(r"[።፤፣፥፧?!\"']+", text)
-
-        for s in split_sentences:
-            s = s.strip()
-            if len(s) >= min_length and s not in seen and re.search(r"[\u1200-\u137F]", s):
-                seen.add(s)
-                cleaned_lines.append(s)
-
-    # Write cleaned sentences
-    with open(output_path, "w", encoding="utf-8") as f:
-        for line in cleaned_lines:
-            f.write(line + "\n")
-
-    print(f"✅ Cleaned {len(cleaned_lines)} sentences written to {output_path}")
+    written = 0
+
+    tmp_path = output_path + ".tmp"
+    try:
+        with open(input_path, "r", encoding="utf-8") as src, open(tmp_path, "w", encoding="utf-8") as dst:
+            for line in src:
+                text = line.strip()
+
+                if not text:
+                    continue
+
+                # Remove Latin letters, digits, and unwanted ASCII punctuation
+                text = _LATIN_RE.sub(" ", text)
+                text = _WHITESPACE_RE.sub(" ", text).strip()
+
+                # Split by Amharic + modern punctuation
+                for s in _SENTENCE_SPLIT_RE.split(text):
+                    s = s.strip()
+                    if len(s) >= min_length and s not in seen and _ETHIOPIC_RE.search(s):
+                        seen.add(s)
+                        dst.write(s + "\n")
+                        written += 1
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    print(f"✅ Cleaned {written} sentences written to {output_path}")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,134 @@
+import hashlib
+import logging
+import logging.handlers
+import math
+import os
+import queue
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 import re
+import sqlite3
+import threading
 import time
 import urllib.parse
-from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode
-from collections import deque
-from typing import List, Set, Optional
+from urllib.parse import ParseResult, urljoin, urlparse, urlunparse, parse_qs, urlencode
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Set, Optional, Tuple
 # from deep_translator import GoogleTranslator  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# Raw-byte sign of Ethiopic text: UTF-8 for U+1200..U+137F starts with \xe1
+# followed by \x88..\x8d; numeric character references around that range
+# (&#4608; / &#x1200;) are matched too, loosely
+ETHIOPIC_BYTES_RE = re.compile(rb"\xe1[\x88-\x8d]|&#(?:0*4[6-9]\d\d|[xX]0*1[23][0-9a-fA-F]{2})")
+
+
+def has_ethiopic_bytes(data: bytes) -> bool:
+    """True if raw HTML ``data`` may contain Ethiopic text."""
+    # Plain substring tests are memchr-fast and rule out most non-Amharic pages
+    # before the alternation regex has to scan
+    if b"\xe1" not in data and b"&#" not in data:
+        return False
+    return ETHIOPIC_BYTES_RE.search(data) is not None
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Sized for ``capacity`` items at ``error_rate`` false positives; the ``k``
+    bit positions come from one blake2b digest split into two 64-bit hashes
+    (Kirsch–Mitzenmacher double hashing).
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.num_bits: int = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes: int = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits: bytearray = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> range:
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return range(h1, h1 + self.num_hashes * h2, h2)
+
+    def __contains__(self, item: str) -> bool:
+        bits, m = self.bits, self.num_bits
+        for h in self._positions(item):
+            pos = h % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def add(self, item: str) -> bool:
+        """Add ``item``; return False if it was (probably) already present."""
+        bits, m = self.bits, self.num_bits
+        new = False
+        for h in self._positions(item):
+            pos = h % m
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                new = True
+        return new
+
+
+class TextAndLinkCollector:
+    """lxml parser target collecting visible text nodes and ``<a href>`` values.
+
+    Yields the same text nodes as ``itertext()`` on a tree whose
+    ``excluded_tags`` elements were emptied, but without building the tree.
+    While ``keep_text`` is False, completed text nodes are dropped; the
+    node in progress is still buffered and kept if the flag turns on.
+    """
+
+    def __init__(self, excluded_tags: frozenset) -> None:
+        self.excluded_tags = excluded_tags
+        self.keep_text: bool = True
+        self.skip_depth: int = 0
+        self.buffer: List[str] = []
+        self.texts: List[str] = []
+        self.hrefs: List[str] = []
+
+    def _flush(self) -> None:
+        # A text node may arrive over several data() calls; it ends at the next event
+        if self.buffer:
+            if self.keep_text:
+                self.texts.append("".join(self.buffer))
+            self.buffer.clear()
+
+    def start(self, tag: str, attrib) -> None:
+        self._flush()
+        if tag == "a":
+            href = attrib.get("href")
+            if href is not None:
+                self.hrefs.append(href)
+        if self.skip_depth:
+            self.skip_depth += 1
+        elif tag in self.excluded_tags:
+            self.skip_depth = 1
+
+    def end(self, tag: str) -> None:
+        self._flush()
+        if self.skip_depth:
+            self.skip_depth -= 1
+
+    def data(self, data: str) -> None:
+        if not self.skip_depth:
+            self.buffer.append(data)
+
+    def comment(self, text: str) -> None:
+        self._flush()
+
+    def pi(self, target: str, data: Optional[str] = None) -> None:
+        self._flush()
+
+    def close(self) -> Tuple[List[str], List[str]]:
+        self._flush()
+        return self.texts, self.hrefs
+
 
 class AmharicCrawler:
     AMHARIC_REGEX = re.compile(r"[\u1200-\u137f]")  # Ethiopic block
@@ -15,6 +136,15 @@ class AmharicCrawler:
 
     UNWANTED_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif", ".svg", ".pdf", ".mp4", ".zip", ".exe", ".webp", ".ico")
     SKIP_KEYWORDS = ("login", "signup", "register", "privacy", "contact", "terms", "policy", "account", "cookie")
+    UNWANTED_SET = frozenset(UNWANTED_EXTENSIONS)
+    SKIP_RE = re.compile("|".join(map(re.escape, SKIP_KEYWORDS)), re.IGNORECASE)
+    NON_HTTP_PREFIXES = ("mailto:", "javascript:", "tel:", "data:")
+    TRACKING_PARAMS = frozenset(("fbclid", "ref"))
+    # key=value pairs that parse_qs + urlencode would reproduce unchanged
+    SIMPLE_QUERY_RE = re.compile(r"[\w.~-]+=[\w.~-]+(?:&[\w.~-]+=[\w.~-]+)*", re.ASCII)
+    FLUSH_EVERY_PAGES = 50
+    # Non-textual or redundant sections left out of text extraction
+    EXCLUDED_TAGS = frozenset(("script", "style", "noscript", "iframe", "header", "footer", "svg", "img", "nav", "form"))
 
     def __init__(
         self,
@@ -22,163 +152,387 @@ class AmharicCrawler:
         max_pages: int = 500,
         delay: float = 1.0,
         output_txt: str = "raw_amharic.txt",
+        max_workers: int = 8,
+        parse_workers: int = 0,
+        dedup_capacity: int = 1_000_000,
+        dedup_error_rate: float = 1e-6,
+        state_db: str = ":memory:",
     ) -> None:
         self.start_urls: List[str] = start_urls
         self.max_pages: int = max_pages
         self.delay: float = delay
         self.output_txt: str = output_txt
-        self.visited: Set[str] = set()
-        self.queue: deque = deque(start_urls)
-
-        # Reset output file
-        open(self.output_txt, "w", encoding="utf-8").close()
+        self.max_workers: int = max_workers
+        # 0 parses on the fetch threads; N > 0 hands bodies to N processes
+        self.parse_workers: int = parse_workers
+        self.parse_pool: Optional[ProcessPoolExecutor] = None
+        # Earliest start time of the next request per host, so concurrent
+        # fetches to one site stay ``delay`` apart
+        self.host_next_slot: Dict[str, float] = {}
+        self.host_lock: threading.Lock = threading.Lock()
+
+        # Frontier (FIFO by id) and visited URLs live in SQLite so large
+        # crawls stay out of the Python heap; pass a file path as
+        # ``state_db`` to make the crawl resumable.
+        self.db: sqlite3.Connection = sqlite3.connect(state_db)
+        self.db.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS visited (url TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS frontier (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT UNIQUE,
+                added_at REAL
+            );
+            """
+        )
+        self.num_visited: int = self.db.execute("SELECT COUNT(*) FROM visited").fetchone()[0]
+        # Fast negative check in front of the visited table
+        self.visited_filter: BloomFilter = BloomFilter(max(max_pages, 1000), 1e-4)
+        for (url,) in self.db.execute("SELECT url FROM visited"):
+            self.visited_filter.add(url)
+        resuming: bool = self.num_visited > 0
+        self.enqueue(start_urls)
+        # Sentences already written, so repeated boilerplate is emitted once;
+        # a resumed crawl starts from the lines already in the output file,
+        # including those of a batch that was rolled back and will be refetched
+        self.seen: BloomFilter = BloomFilter(dedup_capacity, dedup_error_rate)
+        if resuming and os.path.exists(output_txt):
+            with open(output_txt, "rb") as f:
+                for line in f:
+                    self.seen.add(line.rstrip(b"\n").decode("utf-8", "replace"))
+
+        # One keep-alive session for the whole crawl; the pool is sized so
+        # every fetch worker can hold a connection to the same host.
+        self.session: requests.Session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=max(64, max_workers),
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"})
+
+        # Reset output file (append when resuming) and keep it open for the whole crawl;
+        # binary, since each page's lines are encoded once in append_sentences_to_file
+        self.out_fp = open(self.output_txt, "ab" if resuming else "wb", buffering=1 << 20)
+        self.pages_saved: int = 0
+
+    def close(self) -> None:
+        """Flush and close the output file, the HTTP session and the state database.
+
+        ``crawl`` commits after each fully processed batch; anything still
+        uncommitted belongs to an interrupted batch and is rolled back, so
+        its URLs stay in the frontier for a resumed crawl.
+        """
+        if self.out_fp.closed:
+            return
+        self.out_fp.close()
+        self.session.close()
+        self.db.rollback()
+        self.db.close()
+
+    def is_visited(self, url: str) -> bool:
+        """Bloom filter first; only a (possible) hit costs an indexed lookup."""
+        if url not in self.visited_filter:
+            return False
+        return self.db.execute("SELECT 1 FROM visited WHERE url = ?", (url,)).fetchone() is not None
+
+    def enqueue(self, urls: Iterable[str]) -> None:
+        """Add unvisited URLs to the frontier; URLs already queued are ignored."""
+        now = time.time()
+        self.db.executemany(
+            "INSERT OR IGNORE INTO frontier (url, added_at) VALUES (?, ?)",
+            [(url, now) for url in urls if not self.is_visited(url)],
+        )
 
     @staticmethod
     def is_amharic_text(text: str) -> bool:
-        return bool(AmharicCrawler.AMHARIC_REGEX.search(text))
+        # isascii() is O(1) on CPython, so English-only text skips the regex
+        return not text.isascii() and AmharicCrawler.AMHARIC_REGEX.search(text) is not None
 
     @staticmethod
     def clean_text(text: str) -> str:
-        text = text.strip()
-        text = re.sub(r"\s+", " ", text)
-        return text
-
-    @staticmethod
-    def get_page(url: str) -> Optional[str]:
+        # str.split() breaks on the same Unicode whitespace as \s, without the regex engine
+        return " ".join(text.split())
+
+    def wait_for_host(self, url: str) -> None:
+        """Block until ``delay`` has passed since the last request to ``url``'s host.
+
+        Each caller reserves the host's next slot under the lock and sleeps
+        outside it, so fetch threads keep the one-request-per-``delay`` rate
+        of a sequential crawl for every host while other hosts proceed.
+        """
+        host = urlparse(url).netloc
+        with self.host_lock:
+            now = time.monotonic()
+            start = max(now, self.host_next_slot.get(host, now))
+            self.host_next_slot[host] = start + self.delay
+        if start > now:
+            time.sleep(start - now)
+
+    def get_page(self, url: str) -> Optional[Tuple[List[str], Set[str]]]:
+        """Fetch and parse ``url``, returning its Amharic sentences and links.
+
+        Without a parse pool the body is fed to the parser in chunks as it
+        streams in, so the full HTML is never held next to its tree. With
+        one, the body is read whole and parsed in a worker process while
+        this fetch thread waits, keeping parsing off the GIL.
+        """
+        self.wait_for_host(url)
         try:
             url_encoded = urllib.parse.quote(url, safe=":/?=&")
-            resp = requests.get(url_encoded, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
-            resp.raise_for_status()
-            resp.encoding = "utf-8"
-            return resp.text
+            with self.session.get(url_encoded, timeout=10, stream=True) as resp:
+                resp.raise_for_status()
+                if self.parse_pool is None:
+                    return parse_page(resp.iter_content(chunk_size=64 * 1024), url)
+                body: bytes = resp.content
+            return self.parse_pool.submit(parse_page, (body,), url).result()
         except Exception as e:
-            print(f"Failed to fetch {url}: {e}")
+            logger.warning("Failed to fetch %s: %s", url, e)
             return None
 
     @staticmethod
-    def normalize_url(base_url: str, href: str) -> Optional[str]:
-        """Join and clean URLs, removing fragments and tracking params."""
+    def normalize_url(base_url: str, href: str) -> Tuple[str, ParseResult]:
+        """Join and clean URLs, removing fragments and tracking params.
+
+        Returns the normalized URL together with its parsed parts so callers
+        need not parse it again.
+        """
         parsed = urljoin(base_url, href)
         parts = urlparse(parsed)
-        clean_query = {
-            k: v
-            for k, v in parse_qs(parts.query).items()
-            if not (k.lower().startswith("utm") or k.lower() in ["fbclid", "ref"])
-        }
-
-        clean_parts = parts._replace(fragment="", query=urlencode(clean_query, doseq=True))
+        if parts.query and not AmharicCrawler.is_clean_query(parts.query):
+            clean_query = {
+                k: v
+                for k, v in parse_qs(parts.query).items()
+                if not (k.lower().startswith("utm") or k.lower() in AmharicCrawler.TRACKING_PARAMS)
+            }
+            clean_parts = parts._replace(fragment="", query=urlencode(clean_query, doseq=True))
+        elif parts.fragment:
+            clean_parts = parts._replace(fragment="")
+        else:
+            clean_parts = parts
         normalized = urlunparse(clean_parts)
-        return normalized
+        return normalized, clean_parts
+
+    @classmethod
+    def is_clean_query(cls, query: str) -> bool:
+        """True if ``query`` needs no rewriting: plain, distinct, non-tracking keys.
+
+        Such a query comes back unchanged from the ``parse_qs``/``urlencode``
+        round trip, so ``normalize_url`` can keep it as is.
+        """
+        if not cls.SIMPLE_QUERY_RE.fullmatch(query):
+            return False
+        keys = [pair.partition("=")[0] for pair in query.split("&")]
+        if len(set(keys)) != len(keys):
+            return False
+        for key in keys:
+            key = key.lower()
+            if key.startswith("utm") or key in cls.TRACKING_PARAMS:
+                return False
+        return True
 
     @classmethod
-    def extract_links(cls, html: str, base_url: str) -> Set[str]:
-        """Extract only relevant internal links for crawling."""
-        soup = BeautifulSoup(html, "html.parser")
+    def filter_links(cls, hrefs: Iterable[str], base_url: str) -> Set[str]:
+        """Normalize raw ``href`` values and keep the relevant internal links."""
         base_domain = urlparse(base_url).netloc
+        # Loop invariants bound once per page
+        non_http = cls.NON_HTTP_PREFIXES
+        unwanted = cls.UNWANTED_SET
+        skip_search = cls.SKIP_RE.search
+        splitext = os.path.splitext
+        normalize_url = cls.normalize_url
 
         links: Set[str] = set()
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
-            if not href or href.startswith("#"):
+        # Menus and pagination repeat hrefs; each distinct one is checked once
+        checked: Set[str] = set()
+        for href in hrefs:
+            href = href.strip()
+            if not href or href.startswith("#") or href in checked:
                 continue
+            checked.add(href)
 
-            # Normalize
-            normalized = cls.normalize_url(base_url, href)
-            if not normalized:
+            # Cheap rejects before any URL parsing: non-HTTP schemes and
+            # links whose own path already ends in an unwanted extension
+            if href[:11].lower().startswith(non_http):
+                continue
+            href_path = href.split("#", 1)[0].split("?", 1)[0]
+            if splitext(href_path)[1].lower() in unwanted:
                 continue
 
-            parsed = urlparse(normalized)
+            # Normalize
+            normalized, parsed = normalize_url(base_url, href)
 
             # Filter by domain
             if parsed.netloc != base_domain:
                 continue
 
             # Skip file extensions & unwanted paths
-            if normalized.lower().endswith(cls.UNWANTED_EXTENSIONS):
+            if splitext(parsed.path)[1].lower() in unwanted:
                 continue
-            if any(word in normalized.lower() for word in cls.SKIP_KEYWORDS):
+            if skip_search(normalized):
                 continue
 
             links.add(normalized)
 
         return links
 
-    # -------------------- Content Extraction --------------------
-    @classmethod
-    def extract_and_translate_sentences(cls, html: str) -> List[str]:
-        """Extract visible text, split into sentences, translate to Amharic, and return list of lines."""
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Remove non-textual or redundant sections
-        for tag in soup(["script", "style", "noscript", "iframe", "header", "footer", "svg", "img", "nav", "form"]):
-            tag.decompose()
-
-        sentences_am: List[str] = []
-        # translator = GoogleTranslator(source="auto", target="am")
-
-        for t in soup.stripped_strings:
-            if len(t) < 3:
-                continue
-
-            t_clean = cls.clean_text(t)
-            if not t_clean:
-                continue
-
-            # Split into sentences
-            split_sentences = re.split(cls.SENTENCE_SPLIT_REGEX, t_clean)
-            for sent in split_sentences:
-                sent = sent.strip()
-                if len(sent) < 3:
-                    continue
-
-                try:
-                    if cls.is_amharic_text(sent):
-                        sentences_am.append(sent)
-                    # else:
-                        # translated = translator.translate(sent)
-                        # sentences_am.append(translated)
-                        # time.sleep(0.15)
-                except Exception as e:
-                    print(f"  - Translation failed for '{sent[:40]}...': {e}")
-
-        return sentences_am
-
     # -------------------- File Output --------------------
-    def append_sentences_to_file(self, sentences: List[str]) -> None:
-        """Append translated sentences to output file (one per line)."""
-        with open(self.output_txt, "a", encoding="utf-8") as f:
-            for sent in sentences:
-                f.write(sent.replace("\n", " ").strip() + "\n")
+    def append_sentences_to_file(self, sentences: List[str]) -> int:
+        """Append sentences not written before to output file (one per line); return how many."""
+        seen_add = self.seen.add
+        lines = [line for line in (s.replace("\n", " ").strip() for s in sentences) if seen_add(line)]
+        if lines:
+            self.out_fp.write(("\n".join(lines) + "\n").encode("utf-8"))
+        self.pages_saved += 1
+        if self.pages_saved % self.FLUSH_EVERY_PAGES == 0:
+            self.out_fp.flush()
+        return len(lines)
 
     # -------------------- Main Crawler --------------------
-    def crawl(self) -> None:
-        """Main crawl loop."""
-        while self.queue and len(self.visited) < self.max_pages:
-            url: str = self.queue.popleft()
-            if url in self.visited:
-                continue
-            self.visited.add(url)
+    def next_batch(self) -> List[str]:
+        """Pop up to ``max_workers`` unvisited URLs and mark them visited."""
+        batch: List[str] = []
+        limit = min(self.max_workers, self.max_pages - self.num_visited)
+        while len(batch) < limit:
+            rows = self.db.execute(
+                "SELECT id, url FROM frontier ORDER BY id LIMIT ?", (limit - len(batch),)
+            ).fetchall()
+            if not rows:
+                break
+            self.db.executemany("DELETE FROM frontier WHERE id = ?", [(row_id,) for row_id, _ in rows])
+            for _, url in rows:
+                if self.is_visited(url):
+                    continue
+                self.db.execute("INSERT INTO visited (url) VALUES (?)", (url,))
+                self.visited_filter.add(url)
+                self.num_visited += 1
+                batch.append(url)
+                logger.info("[%d] Crawling → %s", self.num_visited, url)
+        return batch
 
-            print(f"[{len(self.visited)}] Crawling → {url}")
-            html: Optional[str] = self.get_page(url)
-            if html is None:
+    def crawl(self) -> None:
+        """Main crawl loop.
+
+        Pages are fetched and parsed ``max_workers`` at a time on a thread
+        pool so that network waits overlap, with parsing optionally spread
+        over ``parse_workers`` processes; file output and the frontier stay
+        on this thread, in queue order. ``delay`` is enforced per host by
+        ``wait_for_host``, so a single-site crawl sends requests no faster
+        than a sequential one; fetches to different hosts run concurrently.
+        """
+        if self.parse_workers > 0:
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                while self.num_visited < self.max_pages:
+                    batch: List[str] = self.next_batch()
+                    if not batch:
+                        break
+                    for url, page in zip(batch, pool.map(self.get_page, batch)):
+                        self.process_page(url, page)
+                    self.db.commit()
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
+            self.close()
+
+        logger.info("✅ Crawled %d pages. Output: %s", self.num_visited, self.output_txt)
+
+    def process_page(self, url: str, page: Optional[Tuple[List[str], Set[str]]]) -> None:
+        """Save a fetched page's Amharic sentences and queue its links."""
+        if page is None:
+            return
+
+        sentences, links = page
+        if sentences:
+            written: int = self.append_sentences_to_file(sentences)
+            logger.info("  ✓ Saved %d new of %d sentences.", written, len(sentences))
+
+        self.enqueue(links)
+
+
+def extract_amharic(texts: Iterable[str]) -> List[str]:
+    """Return the Amharic sentences found in raw text nodes, in order.
+
+    Nodes are whitespace-collapsed and split on sentence terminators;
+    sentences shorter than three characters are dropped.
+    """
+    sentences_am: List[str] = []
+    # translator = GoogleTranslator(source="auto", target="am")
+
+    is_amharic = AmharicCrawler.is_amharic_text
+    clean_text = AmharicCrawler.clean_text
+    split = AmharicCrawler.SENTENCE_SPLIT_REGEX.split
+
+    for t in texts:
+        # Cheapest and most selective test first, on the raw node: one
+        # without Ethiopic text cannot yield an Amharic sentence
+        if not is_amharic(t):
+            continue
+
+        t_clean = clean_text(t)
+        if len(t_clean) < 3:
+            continue
+
+        # Split into sentences
+        for sent in split(t_clean):
+            sent = sent.strip()
+            if len(sent) < 3:
                 continue
 
-            sentences: List[str] = self.extract_and_translate_sentences(html)
-            if sentences:
-                self.append_sentences_to_file(sentences)
-                print(f"  ✓ Saved {len(sentences)} sentences.")
+            try:
+                if is_amharic(sent):
+                    sentences_am.append(sent)
+                # else:
+                    # translated = translator.translate(sent)
+                    # sentences_am.append(translated)
+                    # time.sleep(0.15)
+            except Exception as e:
+                logger.warning("  - Translation failed for '%s...': %s", sent[:40], e)
+
+    return sentences_am
+
+
+def parse_page(chunks: Iterable[bytes], url: str) -> Tuple[List[str], Set[str]]:
+    """Parse an HTML body given as byte chunks into (sentences, links).
+
+    Single pass: a ``TextAndLinkCollector`` target receives parser events
+    directly, so no tree is built. Text is only kept from the first chunk
+    whose raw bytes contain Ethiopic; text before it cannot hold Amharic,
+    and a page without any yields only its links. Module-level so a
+    ``ProcessPoolExecutor`` can pickle it by reference.
+    """
+    collector = TextAndLinkCollector(AmharicCrawler.EXCLUDED_TAGS)
+    collector.keep_text = False
+    parser = etree.HTMLParser(target=collector, encoding="utf-8")
+    carry = b""
+    for chunk in chunks:
+        # Prepend the previous chunk's tail in case a marker was split across chunks
+        if not collector.keep_text:
+            window = carry + chunk
+            if has_ethiopic_bytes(window):
+                collector.keep_text = True
+            carry = window[-16:]
+        parser.feed(chunk)
+    texts, hrefs = parser.close()
+    return extract_amharic(texts), AmharicCrawler.filter_links(hrefs, url)
 
-            links: Set[str] = self.extract_links(html, url)
-            for link in links:
-                if link not in self.visited:
-                    self.queue.append(link)
-
-            time.sleep(self.delay)
-
-        print(f"\n✅ Crawled {len(self.visited)} pages. Output: {self.output_txt}")
 
 if __name__ == "__main__":
+    # Workers only enqueue records; one background thread writes them to stderr
+    log_queue: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+
     START_URLS = ["<URL>"]
     crawler = AmharicCrawler(start_urls=START_URLS, max_pages=500, delay=1.0)
-    crawler.crawl()
+    try:
+        crawler.crawl()
+    finally:
+        listener.stop()
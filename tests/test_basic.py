@@ -18,5 +18,21 @@ def test_roundtrip_basic():
     assert text == detokenized, "Detokenized text does not match the original."
     
 
+
+def test_tokenize_with_assigned_state():
+    """Merges assigned through the public attributes are applied by tokenize."""
+    loaded = AmharicTokenizer.load("amh_bpe_v0.2.5")
+    tok = AmharicTokenizer()
+    tok._vocabulary = loaded._vocabulary
+    tok._merge_rank_map = loaded._merge_rank_map
+    tok._token_to_id = loaded._token_to_id
+    tok._id_to_token = loaded._id_to_token
+    tok._next_id = loaded._next_id
+
+    text = "ሰላም ለሁሉም"
+    assert tok.tokenize(text) == loaded.tokenize(text)
+    assert len(tok.tokenize(text)) == 2
+
+
 if __name__ == "__main__":
     test_roundtrip_basic()
@@ -0,0 +1,35 @@
+"""Tests for cleaning raw crawled Amharic text files."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_crawler"))
+
+from clean import clean_amharic_file  # noqa: E402
+
+RAW = (
+    "ሰላም ለሁሉም ሰው እንዴት ናችሁ። abc ሰላም ለሁሉም ሰው እንዴት ናችሁ\n"
+    "\n"
+    "ኢትዮጵያ ውብ አገር ናት በጣም ብዙ! short\n"
+)
+CLEANED = "ሰላም ለሁሉም ሰው እንዴት ናችሁ\nኢትዮጵያ ውብ አገር ናት በጣም ብዙ\n"
+
+
+def test_clean_to_new_file(tmp_path):
+    """Sentences are split, stripped of Latin text and deduplicated."""
+    src = tmp_path / "raw.txt"
+    src.write_text(RAW, encoding="utf-8")
+    clean_amharic_file(str(src), str(tmp_path / "clean.txt"))
+
+    assert (tmp_path / "clean.txt").read_text(encoding="utf-8") == CLEANED
+    assert src.read_text(encoding="utf-8") == RAW
+
+
+def test_clean_in_place(tmp_path):
+    """Cleaning a file onto itself keeps its content and leaves no temp file."""
+    path = tmp_path / "raw.txt"
+    path.write_text(RAW, encoding="utf-8")
+    clean_amharic_file(str(path), str(path))
+
+    assert path.read_text(encoding="utf-8") == CLEANED
+    assert [p.name for p in tmp_path.iterdir()] == ["raw.txt"]
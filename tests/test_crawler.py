@@ -0,0 +1,182 @@
+"""Offline tests for page parsing in the Amharic web crawler."""
+
+import sys
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "data_crawler"))
+
+from crawl_translate import (  # noqa: E402
+    AmharicCrawler,
+    has_ethiopic_bytes,
+    parse_page,
+)
+
+BASE_URL = "https://example.com/index.html"
+
+PAGE = """<!DOCTYPE html>
+<html><head><title>የዜና ገጽ</title><style>p { color: red }</style>
+<script>var s = "ሰላም ከስክሪፕት።";</script></head>
+<body>
+<nav><a href="/menu">ዋና ገጽ</a><img src="logo.png"><br>የምናሌ ጽሑፍ</nav>
+ከምናሌው በኋላ ያለ ጽሑፍ ነው። ሁለተኛ ዓረፍተ ነገር!
+<!-- የተደበቀ አስተያየት -->
+<p>Hello world. ኢትዮጵያ ውብ አገር ናት።</p>
+<footer>የግርጌ ጽሑፍ</footer>
+<a href="/news/1#top">ዜና</a> <a href="https://other.example/x">ሌላ</a>
+<a href="/photo.jpg">ፎቶ</a> <a href="mailto:a@example.com">ኢሜል</a>
+<a href="/login">ግባ</a>
+</body></html>
+""".encode("utf-8")
+
+PAGE_SENTENCES = [
+    "የዜና ገጽ",
+    "ከምናሌው በኋላ ያለ ጽሑፍ ነው።",
+    "ሁለተኛ ዓረፍተ ነገር!",
+    "ኢትዮጵያ ውብ አገር ናት።",
+    "ኢሜል",
+]
+PAGE_LINKS = {"https://example.com/menu", "https://example.com/news/1"}
+
+
+def byte_chunks(data, size=1):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_parse_page_whole_body():
+    """Excluded sections and comments are dropped; tail text and nav links are kept."""
+    sentences, links = parse_page([PAGE], BASE_URL)
+
+    assert sentences == PAGE_SENTENCES
+    assert links == PAGE_LINKS
+
+
+def test_parse_page_one_byte_chunks():
+    """Feeding the body one byte at a time gives the same result as one chunk."""
+    assert parse_page(byte_chunks(PAGE), BASE_URL) == (PAGE_SENTENCES, PAGE_LINKS)
+
+
+def test_parse_page_utf8_split_across_chunks():
+    """An Ethiopic character split between two chunks still turns on text collection."""
+    # The page's only Ethiopic byte sequence is cut after its lead byte
+    page = "<p>English first.</p><p>ሰ is a letter</p>".encode("utf-8")
+    split = page.index(b"\xe1") + 1
+    chunks = [page[:split], page[split:]]
+
+    assert not has_ethiopic_bytes(chunks[0])
+    assert not has_ethiopic_bytes(chunks[1])
+    assert parse_page(chunks, BASE_URL) == (["ሰ is a letter"], set())
+
+
+def test_parse_page_entity_encoded_amharic():
+    """Amharic written only as numeric character references is not filtered out."""
+    page = b"<p>&#4656;&#4619;&#4637; &#x1208;&#x1201;&#x1209;&#x121d;</p>"
+
+    assert has_ethiopic_bytes(page)
+    assert parse_page([page], BASE_URL)[0] == ["ሰላም ለሁሉም"]
+    assert parse_page(byte_chunks(page), BASE_URL)[0] == ["ሰላም ለሁሉም"]
+
+
+def test_parse_page_english_only():
+    """A page without Ethiopic text yields no sentences but keeps its links."""
+    page = b'<p>Hello world. Nothing to keep here.</p><a href="/am/news">News</a>'
+
+    assert not has_ethiopic_bytes(page)
+    assert parse_page([page], BASE_URL) == ([], {"https://example.com/am/news"})
+
+
+@pytest.mark.parametrize(
+    ("href", "expected"),
+    [
+        ("/p?x", "https://example.com/p"),
+        ("/p?a=1&b=2&a=3", "https://example.com/p?a=1&a=3&b=2"),
+        ("/p?utm_source=tw&id=5&fbclid=abc&ref=home", "https://example.com/p?id=5"),
+        ("/p?UTM_Medium=x&id=5", "https://example.com/p?id=5"),
+        ("/p?id=5#top", "https://example.com/p?id=5"),
+        ("/p?id=5&page=2", "https://example.com/p?id=5&page=2"),
+        ("/p#top", "https://example.com/p"),
+    ],
+)
+def test_normalize_url(href, expected):
+    """Tracking params and fragments are dropped; repeated keys are grouped."""
+    normalized, parts = AmharicCrawler.normalize_url(BASE_URL, href)
+
+    assert normalized == expected
+    assert urlunparse(parts) == normalized
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["x", "a=1&b=2", "a=1&a=1", "a=&b=2", "a=x+y", "q=%E1%88%B0", "a=1;b=2", "ref=1"],
+)
+def test_normalize_url_fast_path_matches_round_trip(query):
+    """Queries kept as-is come back unchanged from parse_qs/urlencode."""
+    parts = urlparse(urljoin(BASE_URL, "/p?" + query))
+    clean_query = {
+        k: v
+        for k, v in parse_qs(parts.query).items()
+        if not (k.lower().startswith("utm") or k.lower() in {"fbclid", "ref"})
+    }
+    expected = urlunparse(parts._replace(query=urlencode(clean_query, doseq=True)))
+
+    assert AmharicCrawler.normalize_url(BASE_URL, "/p?" + query)[0] == expected
+
+
+def fake_page(self, url):
+    """Stand-in for AmharicCrawler.get_page on a binary tree of pages."""
+    i = int(url.rsplit("/", 1)[1])
+    sentences = [f"ገጽ ቁጥር {i} ነው።", "የጋራ ግርጌ ጽሑፍ።"]
+    return sentences, {
+        f"https://example.com/{2 * i + 1}",
+        f"https://example.com/{2 * i + 2}",
+    }
+
+
+def run_crawl(tmp_path, name, max_pages, state_db=":memory:"):
+    crawler = AmharicCrawler(
+        ["https://example.com/0"],
+        max_pages=max_pages,
+        delay=0,
+        output_txt=str(tmp_path / name),
+        max_workers=4,
+        state_db=state_db,
+    )
+    crawler.crawl()
+    return (tmp_path / name).read_text(encoding="utf-8").splitlines()
+
+
+def test_resumed_crawl_writes_no_duplicates(tmp_path, monkeypatch):
+    """Resuming from a state database appends only sentences not written before."""
+    monkeypatch.setattr(AmharicCrawler, "get_page", fake_page)
+    expected = run_crawl(tmp_path, "once.txt", 30)
+    state_db = str(tmp_path / "state.db")
+
+    run_crawl(tmp_path, "resumed.txt", 10, state_db)
+    resumed = run_crawl(tmp_path, "resumed.txt", 30, state_db)
+
+    assert resumed == expected
+    assert len(set(resumed)) == len(resumed)
+
+
+def test_interrupted_batch_is_refetched_without_duplicates(tmp_path, monkeypatch):
+    """A batch interrupted after writing output is crawled again on resume."""
+    monkeypatch.setattr(AmharicCrawler, "get_page", fake_page)
+    expected = run_crawl(tmp_path, "once.txt", 30)
+    state_db = str(tmp_path / "state.db")
+    process_page = AmharicCrawler.process_page
+
+    def interrupt_on_page_6(self, url, page):
+        process_page(self, url, page)
+        if url.endswith("/6"):
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(AmharicCrawler, "process_page", interrupt_on_page_6)
+    with pytest.raises(KeyboardInterrupt):
+        run_crawl(tmp_path, "resumed.txt", 30, state_db)
+    monkeypatch.setattr(AmharicCrawler, "process_page", process_page)
+    resumed = run_crawl(tmp_path, "resumed.txt", 30, state_db)
+
+    assert sorted(resumed) == sorted(expected)
+    assert len(set(resumed)) == len(resumed)
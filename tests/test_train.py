@@ -0,0 +1,106 @@
+"""Tests for training the AmharicTokenizer on a small corpus."""
+
+import json
+
+from amharic_tokenizer import AmharicTokenizer
+
+CORPUS = (
+    "ሰላም ሰላም ለሁሉም ሰው። ኢትዮጵያ ውብ አገር ናት። የኢትዮጵያ ህዝብ ሰላም ይፈልጋል። "
+    "ሰው ሁሉ በሰላም ይኑር። አገር የህዝብ ናት።"
+)
+
+
+def test_train_learns_frequent_merges():
+    """Training records ranked merges whose counts respect the merge order."""
+    tok = AmharicTokenizer(num_merges=40)
+    learned = tok.train(CORPUS)
+
+    assert learned == len(tok._merge_rank_map) > 0
+    ranked = sorted(tok._merge_rank_map, key=tok._merge_rank_map.get)
+    assert ranked[0] in tok._token_to_id
+    assert all(tok._vocabulary[token] >= 2 for token in ranked)
+
+
+def test_train_roundtrip():
+    """Text tokenized with freshly learned merges detokenizes back unchanged."""
+    tok = AmharicTokenizer(num_merges=40)
+    tok.train(CORPUS)
+    text = "ሰላም ለሁሉም ሰው። ኢትዮጵያ ውብ አገር ናት።"
+
+    tokens = tok.tokenize(text)
+    assert any(token in tok._merge_rank_map for token in tokens)
+    assert tok.detokenize(tokens) == text
+
+
+def test_train_merges_overlapping_runs():
+    """Runs of one repeated syllable (A A A) merge left to right without error."""
+    tok = AmharicTokenizer(num_merges=50)
+    tok.train("ሀሀሀሀ ሀሀሀ ሀሀ ለለለለለ " * 3)
+
+    assert tok._merge_rank_map == {
+        "ሀአ": 1,
+        "ሀአሀአ": 2,
+        "ለአ": 3,
+        "ለአለአ": 4,
+        "ሀአሀአ<eow>": 5,
+        "ሀአ<eow>": 6,
+        "ለአ<eow>": 7,
+        "ለአለአለአለአ": 8,
+        "ሀአሀአሀአሀአ<eow>": 9,
+        "ሀአሀአሀአ<eow>": 10,
+        "ለአለአለአለአለአ<eow>": 11,
+    }
+
+
+def test_train_parallel_word_count_matches_serial():
+    """Counting words across worker processes learns the same merges."""
+    corpus = " ".join([CORPUS] * 12000)
+    serial = AmharicTokenizer(num_merges=40)
+    serial.train(corpus)
+    parallel = AmharicTokenizer(num_merges=40)
+    parallel.train(corpus, num_workers=2)
+
+    assert parallel._merge_rank_map == serial._merge_rank_map
+    assert parallel._vocabulary == serial._vocabulary
+
+
+def test_train_stream_matches_train():
+    """Training from an iterable of lines learns the same merges as train."""
+    lines = CORPUS.replace("። ", "።\n").splitlines(keepends=True)
+    from_text = AmharicTokenizer(num_merges=40)
+    from_text.train(CORPUS)
+    from_lines = AmharicTokenizer(num_merges=40)
+    from_lines.train_stream(iter(lines))
+
+    assert from_lines._merge_rank_map == from_text._merge_rank_map
+    assert from_lines._vocabulary == from_text._vocabulary
+
+
+def test_train_stream_small_input_skips_pool(monkeypatch):
+    """Requesting workers for a small stream counts it without a process pool."""
+    import amharic_tokenizer.tokenizer as tokenizer_module
+
+    def fail_pool(*args, **kwargs):
+        raise AssertionError("process pool started for a small input")
+
+    monkeypatch.setattr(tokenizer_module, "Pool", fail_pool)
+    lines = CORPUS.replace("። ", "።\n").splitlines(keepends=True)
+    from_text = AmharicTokenizer(num_merges=40)
+    from_text.train(CORPUS)
+    from_lines = AmharicTokenizer(num_merges=40)
+    from_lines.train_stream(iter(lines), num_workers=4)
+
+    assert from_lines._merge_rank_map == from_text._merge_rank_map
+
+
+def test_save_writes_json_state(tmp_path):
+    """Saved state is valid UTF-8 JSON carrying the learned merges and ids."""
+    tok = AmharicTokenizer(num_merges=40)
+    tok.train(CORPUS)
+    tok.save(str(tmp_path / "model"))
+
+    with open(tmp_path / "model.json", encoding="utf-8") as f:
+        state = json.load(f)
+    assert state["merge_rank_map"] == tok._merge_rank_map
+    assert state["token_to_id"] == tok._token_to_id
+    assert {int(k): v for k, v in state["id_to_token"].items()} == tok._id_to_token